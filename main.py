@@ -8,10 +8,8 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from visa_jobs.config import AppConfig
-from visa_jobs.pipeline import run_pipeline
+from visa_jobs.__main__ import main
 
 
 if __name__ == "__main__":
-    config = AppConfig.from_env()
-    run_pipeline(config)
+    main()
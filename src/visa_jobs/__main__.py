@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from .config import AppConfig
+from .pipeline import run_pipeline
+
+
+def main() -> None:
+    run_pipeline(AppConfig.from_env())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from urllib.parse import urlparse
+
+from playwright.async_api import Browser, BrowserContext, Page, Playwright, Route, async_playwright
+
+logger = logging.getLogger(__name__)
+
+CHROMIUM_ARGS = ["--disable-gpu", "--single-process", "--blink-settings=imagesEnabled=false"]
+BLANK_URL = "about:blank"
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_TRACKER_HOSTS = {
+    "doubleclick.net",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "analytics.google.com",
+}
+_TRACKER_SUFFIXES = tuple(f".{host}" for host in BLOCKED_TRACKER_HOSTS)
+
+
+class PagePool:
+    """Lend reusable pages from one browser context instead of opening a tab per URL."""
+
+    def __init__(self, context: BrowserContext, size: int):
+        self._context = context
+        self._size = max(1, size)
+        self._created = 0
+        self._idle: asyncio.Queue[Page] = asyncio.Queue()
+
+    async def open(self) -> None:
+        """Pre-open every page so tasks never pay for tab creation while scraping."""
+        while self._created < self._size:
+            self._created += 1
+            self._idle.put_nowait(await self._context.new_page())
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        page = await self._checkout()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def release(self, page: Page) -> None:
+        try:
+            await page.goto(BLANK_URL)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Replacing page that failed to reset (%s)", exc)
+            await self._replace(page)
+            return
+        self._idle.put_nowait(page)
+
+    async def _checkout(self) -> Page:
+        if self._idle.empty() and self._created < self._size:
+            self._created += 1
+            try:
+                return await self._context.new_page()
+            except Exception:
+                self._created -= 1
+                raise
+        return await self._idle.get()
+
+    async def _replace(self, page: Page) -> None:
+        try:
+            await page.close()
+        except Exception:  # noqa: BLE001
+            pass
+        try:
+            self._idle.put_nowait(await self._context.new_page())
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Unable to open replacement page (%s)", exc)
+            self._created -= 1
+
+
+class BrowserManager:
+    """Start Playwright and a browser once and expose a pool of pages from the shared context."""
+
+    def __init__(self, concurrent_browsers: int = 4):
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._context: BrowserContext | None = None
+        self._pages: PagePool | None = None
+        self._concurrent_browsers = concurrent_browsers
+
+    async def __aenter__(self) -> "BrowserManager":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        self._playwright = await async_playwright().start()
+        try:
+            self._browser = await self._playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+            browser_name = "chromium"
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Chromium launch failed (%s); falling back to Firefox", exc)
+            self._browser = await self._playwright.firefox.launch(headless=True)
+            browser_name = "firefox"
+        self._context = await self._browser.new_context()
+        await self._context.route("**/*", _filter_route)
+        self._pages = PagePool(self._context, self._concurrent_browsers)
+        await self._pages.open()
+        logger.info("Using %s browser context for scraping", browser_name)
+
+    @property
+    def pages(self) -> PagePool:
+        if self._pages is None:
+            raise RuntimeError("BrowserManager has not been started")
+        return self._pages
+
+    async def close(self) -> None:
+        self._pages = None
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+
+async def _filter_route(route: Route) -> None:
+    request = route.request
+    if request.is_navigation_request() or request.resource_type == "document":
+        await route.continue_()
+    elif request.resource_type in BLOCKED_RESOURCE_TYPES or _is_tracker(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _is_tracker(url: str) -> bool:
+    host = (urlparse(url).hostname or "").lower()
+    return host in BLOCKED_TRACKER_HOSTS or host.endswith(_TRACKER_SUFFIXES)
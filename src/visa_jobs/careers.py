@@ -1,23 +1,39 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
-from typing import List, Optional
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Awaitable, Callable, Iterable, List, Optional
 from urllib.parse import parse_qs, unquote, urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
-from playwright.async_api import BrowserContext, Page, async_playwright
+import diskcache
+import httpx
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from selectolax.lexbor import LexborHTMLParser
+
+from .browser_manager import PagePool
+from .config import EXCLUSION_KEYWORDS
 
 logger = logging.getLogger(__name__)
 
 DUCKDUCKGO_HTML_URL = "https://duckduckgo.com/html/"
+DUCKDUCKGO_RESULT_SELECTOR = "a.result__a"
 BING_SEARCH_URL = "https://www.bing.com/search"
+BING_RESULT_SELECTOR = "li.b_algo h2 a"
 USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36"
 SEARCH_TIMEOUT = 8
-PAGE_TIMEOUT_MS = 10000
+PAGE_TIMEOUT_MS = 8000
+RENDER_WAIT_MS = 5000
 MAX_SEARCH_RESULTS = 5
 MIN_JOB_LINKS = 3
+MIN_JOB_DESCRIPTION_CHARS = 1000
+MAX_JOB_DESCRIPTION_CHARS = 20000
+CAREER_CACHE_TTL = 7 * 86400
+SPA_SHELL_SELECTOR = "#root, #app, #__next, #__nuxt, [data-reactroot], [ng-version], [ng-app]"
 CAREER_KEYWORDS = ["career", "careers", "jobs", "join us", "work with us"]
 CAREER_LINK_KEYWORDS = ["job", "career", "vacanc", "opportun", "opening", "join", "work"]
 JOB_KEYWORDS = ["qa", "quality", "test", "testing", "sdet", "automation"]
@@ -43,148 +59,204 @@ AGGREGATOR_DOMAINS = {
     "icims.com",
 }
 GOTO_SEMAPHORE = asyncio.Semaphore(3)
+_SEARCH_CLIENT: httpx.AsyncClient | None = None
+_PARSE_POOL: ProcessPoolExecutor | None = None
+
+
+def _keyword_pattern(keywords: Iterable[str], whole_words: bool = False) -> re.Pattern[str]:
+    """Compile ``keywords`` into one regex with shared prefixes merged, so each position walks a trie."""
+    trie: dict = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+    alternation = _trie_regex(trie)
+    return re.compile(rf"\b(?:{alternation})\b" if whole_words else alternation)
+
+
+def _trie_regex(node: dict) -> str:
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    if "" not in node and len(branches) == 1:
+        return branches[0]
+    return f"(?:{'|'.join(branches)})" + ("?" if "" in node else "")
+
+
+_JOB_RE = _keyword_pattern(JOB_KEYWORDS)
+_NAV_RE = _keyword_pattern(NAV_KEYWORDS)
+_EXCLUDED_TITLE_RE = _keyword_pattern(EXCLUSION_KEYWORDS, whole_words=True)
+_AGGREGATOR_SUFFIXES = tuple(f".{domain}" for domain in AGGREGATOR_DOMAINS)
+ANCHOR_PAIRS_JS = "els => els.map(e => [(e.innerText || '').trim(), e.getAttribute('href') || ''])"
+JOB_BODY_JS = """(body, {excluded, maxChars}) => {
+  const text = (body.innerText || '').replace(/\\s+/g, ' ').trim();
+  const lower = text.toLowerCase();
+  if (excluded.some(k => lower.includes(k))) return null;
+  return text.slice(0, maxChars);
+}"""
+CAREER_PAGE_CHECK_JS = """(body, {careerKws, linkKws, minLinks}) => {
+  const title = (document.title || '').toLowerCase();
+  const text = (body.innerText || '').toLowerCase();
+  if (!careerKws.some(k => title.includes(k)) && !careerKws.some(k => text.includes(k))) return false;
+  let links = 0;
+  for (const a of document.querySelectorAll('a')) {
+    const s = ((a.innerText || '') + ' ' + (a.getAttribute('href') || '')).toLowerCase();
+    if (linkKws.some(k => s.includes(k)) && ++links >= minLinks) return true;
+  }
+  return false;
+}"""
 
 
 async def find_real_career_page(
-    company_name: str, context: BrowserContext | None = None, max_results: int | None = None
+    company_name: str,
+    pages: PagePool,
+    max_results: int | None = None,
+    cache: diskcache.Cache | None = None,
 ) -> Optional[str]:
-    """Locate a verifiable career page with staged fallbacks."""
-    cleanup = None
-    if context is None:
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=True)
-        context = await browser.new_context()
-        cleanup = (playwright, browser, context)
+    """Locate a verifiable career page with staged fallbacks, memoizing the outcome in ``cache``."""
+    key = company_name.lower().strip()
+    if cache is not None:
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Using cached career page lookup for %s", company_name)
+            return cached or None
+
+    failures: list[str] = []
+    url = await _find_career_page(company_name, pages, max_results or MAX_SEARCH_RESULTS, failures)
+    if cache is not None:
+        if url or not failures:
+            cache.set(key, url or "", expire=CAREER_CACHE_TTL)
+        else:
+            logger.info("Not caching miss for %s; lookups failed: %s", company_name, ", ".join(failures))
+    return url
 
-    limit = max_results or MAX_SEARCH_RESULTS
 
-    try:
-        url = await _locate_via_strategies(company_name, context, limit)
-        if url:
-            return url
-        trimmed = _safe_mode_variant(company_name)
-        if trimmed and trimmed.lower() != company_name.lower():
-            logger.info("Safe-mode retry for %s via %s", company_name, trimmed)
-            return await _locate_via_strategies(trimmed, context, limit)
-        logger.info("No valid career page found for %s", company_name)
-        return None
-    finally:
-        if cleanup:
-            playwright, browser, temp_context = cleanup
-            await temp_context.close()
-            await browser.close()
-            await playwright.stop()
+async def _find_career_page(
+    company_name: str, pages: PagePool, limit: int, failures: list[str]
+) -> Optional[str]:
+    """Search for the career page; lookups that error out are recorded in ``failures`` instead of raising."""
+    url = await _locate_via_strategies(company_name, pages, limit, failures)
+    if url:
+        return url
+    trimmed = _safe_mode_variant(company_name)
+    if trimmed and trimmed.lower() != company_name.lower():
+        logger.info("Safe-mode retry for %s via %s", company_name, trimmed)
+        return await _locate_via_strategies(trimmed, pages, limit, failures)
+    logger.info("No valid career page found for %s", company_name)
+    return None
 
 
-async def _locate_via_strategies(company_name: str, context: BrowserContext, limit: int) -> Optional[str]:
-    search_strategies = [
-        ("duckduckgo-html", lambda: _duckduckgo_search(f"{company_name} careers jobs", limit)),
-        ("bing-html", lambda: _bing_search(f"{company_name} careers jobs", limit)),
+async def _locate_via_strategies(
+    company_name: str, pages: PagePool, limit: int, failures: list[str]
+) -> Optional[str]:
+    search_strategies: list[tuple[str, Callable[[str, int], Awaitable[list[str]]]]] = [
+        ("duckduckgo-html", _duckduckgo_search),
+        ("bing-html", _bing_search),
     ]
+    query = f"{company_name} careers jobs"
+    url = await _first_result(
+        _run_search_strategy(company_name, query, label, search, pages, limit, failures)
+        for label, search in search_strategies
+    )
+    if url:
+        return url
 
-    for label, fetch in search_strategies:
-        try:
-            candidates = fetch()
-        except requests.RequestException as exc:
-            logger.warning("Strategy %s failed for %s (%s)", label, company_name, exc)
-            continue
-        url = await _first_valid_candidate(company_name, candidates, context, label)
-        if url:
-            return url
-
-    homepage = _discover_homepage(company_name, limit)
+    homepage = await _discover_homepage(company_name, limit, failures)
     if homepage and not _is_aggregator(homepage):
-        nav_links = await _discover_nav_links(homepage, context)
-        url = await _first_valid_candidate(company_name, nav_links, context, "homepage-nav")
+        nav_links = await _discover_nav_links(homepage, pages, failures)
+        url = await _first_valid_candidate(company_name, nav_links, pages, "homepage-nav", failures)
         if url:
             return url
     return None
 
 
-async def extract_qa_jobs(
-    career_page_url: str, company_name: str, context: BrowserContext | None = None
-) -> List[dict]:
-    """Extract QA/SDET jobs from a validated career page."""
-    cleanup = None
-    if context is None:
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(headless=True)
-        context = await browser.new_context()
-        cleanup = (playwright, browser, context)
+async def _run_search_strategy(
+    company_name: str,
+    query: str,
+    label: str,
+    search: Callable[[str, int], Awaitable[list[str]]],
+    pages: PagePool,
+    limit: int,
+    failures: list[str],
+) -> Optional[str]:
+    try:
+        candidates = await search(query, limit)
+    except httpx.HTTPError as exc:
+        logger.warning("Strategy %s failed for %s (%s)", label, company_name, exc)
+        failures.append(label)
+        return None
+    return await _first_valid_candidate(company_name, candidates, pages, label, failures)
+
+
+async def extract_qa_jobs(career_page_url: str, company_name: str, pages: PagePool) -> List[dict]:
+    """Extract QA/SDET jobs from a validated career page.
+
+    The page is first fetched over plain HTTP and its anchors parsed with selectolax; when that HTML is
+    real markup its links are final. The browser renders the page only for script-app shells, pages
+    without anchors, or when the plain fetch fails.
+    """
+    anchors = await _fetch_static_anchors(career_page_url)
+    if anchors is None:
+        anchors = await _render_anchors(career_page_url, pages)
+        if anchors is None:
+            return []
+    job_links = _collect_job_links(*anchors)
+    return await _validate_job_links(job_links, company_name, career_page_url, pages)
+
 
+async def _validate_job_links(
+    job_links: dict[str, str], company_name: str, career_page_url: str, pages: PagePool
+) -> list[dict]:
     job_entries: list[dict] = []
-    try:
-        page = await context.new_page()
-        try:
-            response = await _goto_with_limit(page, career_page_url)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Career page navigation failed for %s (%s)", career_page_url, exc)
-            await page.close()
-            return job_entries
+    for job_url, text in job_links.items():
+        job_data = await _validate_job_link(pages, job_url, company_name, career_page_url, fallback_title=text)
+        if job_data:
+            job_entries.append(job_data)
+    return job_entries
 
-        if not response or response.status != 200:
-            logger.warning("Career page %s returned status %s", career_page_url, response.status if response else None)
-            await page.close()
-            return job_entries
-
-        anchors = await page.query_selector_all("a")
-        seen_urls: set[str] = set()
-        for anchor in anchors:
-            text = (await anchor.inner_text() or "").strip()
-            href = await anchor.get_attribute("href")
-            if not href:
-                continue
-            absolute_url = urljoin(response.url, href)
-            if absolute_url in seen_urls or _is_aggregator(absolute_url):
-                continue
-            if not _looks_like_job_link(text.lower(), absolute_url.lower()):
-                continue
-            seen_urls.add(absolute_url)
-            job_data = await _validate_job_link(context, absolute_url, company_name, career_page_url, fallback_title=text)
-            if job_data:
-                job_entries.append(job_data)
-        await page.close()
-        return job_entries
-    finally:
-        if cleanup:
-            playwright, browser, temp_context = cleanup
-            await temp_context.close()
-            await browser.close()
-            await playwright.stop()
 
+async def close_search_client() -> None:
+    """Close the shared search HTTP client; call once scraping has finished."""
+    global _SEARCH_CLIENT
+    if _SEARCH_CLIENT is not None:
+        await _SEARCH_CLIENT.aclose()
+        _SEARCH_CLIENT = None
 
-def _duckduckgo_search(query: str, limit: int) -> list[str]:
-    payload = {"q": query}
-    response = requests.post(
-        DUCKDUCKGO_HTML_URL, data=payload, headers=_search_headers(), timeout=SEARCH_TIMEOUT
-    )
+
+def shutdown_parse_pool() -> None:
+    """Stop the HTML parsing worker processes; call once scraping has finished."""
+    global _PARSE_POOL
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(cancel_futures=True)
+        _PARSE_POOL = None
+
+
+async def _duckduckgo_search(query: str, limit: int) -> list[str]:
+    response = await _search_client().post(DUCKDUCKGO_HTML_URL, data={"q": query})
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
-    links: list[str] = []
-    for anchor in soup.select("a.result__a"):
-        href = anchor.get("href")
-        if not href:
-            continue
-        cleaned = _normalize_search_result(href)
-        if cleaned and not _is_aggregator(cleaned):
-            links.append(cleaned)
-        if len(links) >= limit:
-            break
-    return links
+    if response.status_code == 202:
+        # DuckDuckGo answers throttled clients with an empty 202 page rather than an error status.
+        raise httpx.HTTPStatusError("DuckDuckGo throttled the search", request=response.request, response=response)
+    return await _parse_search_results(response.text, DUCKDUCKGO_RESULT_SELECTOR, limit)
 
 
-def _bing_search(query: str, limit: int) -> list[str]:
-    response = requests.get(
-        BING_SEARCH_URL,
-        params={"q": query},
-        headers=_search_headers(),
-        timeout=SEARCH_TIMEOUT,
-    )
+async def _bing_search(query: str, limit: int) -> list[str]:
+    response = await _search_client().get(BING_SEARCH_URL, params={"q": query})
     response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    return await _parse_search_results(response.text, BING_RESULT_SELECTOR, limit)
+
+
+async def _parse_search_results(html: str, selector: str, limit: int) -> list[str]:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_parse_pool(), _extract_result_links, html, selector, limit)
+
+
+def _extract_result_links(html: str, selector: str, limit: int) -> list[str]:
+    tree = LexborHTMLParser(html)
     links: list[str] = []
-    for anchor in soup.select("li.b_algo h2 a"):
-        href = anchor.get("href")
+    for node in tree.css(selector):
+        href = node.attributes.get("href")
         if not href:
             continue
         cleaned = _normalize_search_result(href)
@@ -195,113 +267,190 @@ def _bing_search(query: str, limit: int) -> list[str]:
     return links
 
 
-def _discover_homepage(company_name: str, limit: int) -> Optional[str]:
+async def _discover_homepage(company_name: str, limit: int, failures: list[str]) -> Optional[str]:
     try:
-        candidates = _duckduckgo_search(company_name, limit)
-    except requests.RequestException as exc:
+        candidates = await _duckduckgo_search(company_name, limit)
+    except httpx.HTTPError as exc:
         logger.warning("Homepage discovery failed for %s (%s)", company_name, exc)
+        failures.append("homepage")
         return None
     return next((url for url in candidates if not _is_aggregator(url)), None)
 
 
 async def _first_valid_candidate(
-    company_name: str, candidates: list[str], context: BrowserContext, strategy_name: str
+    company_name: str, candidates: list[str], pages: PagePool, strategy_name: str, failures: list[str]
 ) -> Optional[str]:
+    async def check(url: str) -> Optional[str]:
+        verdict = await _is_valid_career_page(url, pages)
+        if verdict is None:
+            failures.append(url)
+        return url if verdict else None
+
+    normalized_candidates: list[str] = []
+    seen: set[str] = set()
     for raw_url in candidates:
         normalized = _normalize_search_result(raw_url)
-        if not normalized or _is_aggregator(normalized):
+        if not normalized or normalized in seen or _is_aggregator(normalized):
             continue
-        if await _is_valid_career_page(normalized, context):
-            logger.info("Strategy %s succeeded for %s with %s", strategy_name, company_name, normalized)
-            return normalized
+        seen.add(normalized)
+        normalized_candidates.append(normalized)
+
+    url = await _first_result(check(candidate) for candidate in normalized_candidates)
+    if url:
+        logger.info("Strategy %s succeeded for %s with %s", strategy_name, company_name, url)
+        return url
     logger.info("Strategy %s found no valid page for %s", strategy_name, company_name)
     return None
 
 
-async def _is_valid_career_page(url: str, context: BrowserContext) -> bool:
-    page = await context.new_page()
+async def _first_result(coroutines: Iterable[Awaitable[Optional[str]]]) -> Optional[str]:
+    """Run the coroutines concurrently and return the first truthy result, cancelling the rest."""
+    tasks = [asyncio.ensure_future(coroutine) for coroutine in coroutines]
     try:
-        response = await _goto_with_limit(page, url)
-        if not response or response.status != 200:
-            return False
-        title = (await page.title() or "").lower()
-        body = (await page.inner_text("body")).lower()
-        if not any(term in title for term in CAREER_KEYWORDS) and not any(term in body for term in CAREER_KEYWORDS):
-            return False
-        anchors = await page.query_selector_all("a")
-        job_links = 0
-        for anchor in anchors:
-            text = (await anchor.inner_text() or "").strip()
-            href = await anchor.get_attribute("href") or ""
-            if _looks_like_career_link(text.lower(), href.lower()):
-                job_links += 1
-                if job_links >= MIN_JOB_LINKS:
-                    return True
-        return False
-    except Exception as exc:  # noqa: BLE001
-        logger.debug("Career validation failed for %s: %s", url, exc)
-        return False
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if result:
+                return result
+        return None
     finally:
-        await page.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _is_valid_career_page(url: str, pages: PagePool) -> Optional[bool]:
+    """Judge a loaded candidate page; ``None`` means it never loaded (error, timeout, non-200)."""
+    async with pages.acquire() as page:
+        try:
+            response = await _goto_with_limit(page, url)
+            if not response or response.status != 200:
+                logger.debug("Career candidate %s returned status %s", url, response.status if response else None)
+                return None
+            await page.wait_for_load_state("domcontentloaded", timeout=RENDER_WAIT_MS)
+            is_career_page = await page.locator("body").evaluate(
+                CAREER_PAGE_CHECK_JS,
+                {"careerKws": CAREER_KEYWORDS, "linkKws": CAREER_LINK_KEYWORDS, "minLinks": MIN_JOB_LINKS},
+            )
+            return bool(is_career_page)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Career validation failed for %s: %s", url, exc)
+            return None
 
 
 async def _validate_job_link(
-    context: BrowserContext,
+    pages: PagePool,
     job_url: str,
     company_name: str,
     career_page_url: str,
     fallback_title: str | None = None,
 ) -> Optional[dict]:
-    page = await context.new_page()
-    try:
-        response = await _goto_with_limit(page, job_url)
-        if not response or response.status != 200:
-            return None
-        body_text = await page.inner_text("body")
-        normalized = " ".join(body_text.split())
-        if len(normalized) < 1000:
+    async with pages.acquire() as page:
+        try:
+            response = await _goto_with_limit(page, job_url)
+            if not response or response.status != 200:
+                return None
+            normalized = await page.locator("body").evaluate(
+                JOB_BODY_JS, {"excluded": EXCLUDED_TERMS, "maxChars": MAX_JOB_DESCRIPTION_CHARS}
+            )
+            if normalized is None or len(normalized) < MIN_JOB_DESCRIPTION_CHARS:
+                return None
+            title = fallback_title or (await page.title() or "").strip()
+            if not title:
+                return None
+            return {
+                "company_name": company_name,
+                "career_page_url": career_page_url,
+                "job_title": title,
+                "job_url": response.url,
+                "job_description": normalized,
+            }
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Job validation failed for %s: %s", job_url, exc)
             return None
-        lower_body = normalized.lower()
-        if any(term in lower_body for term in EXCLUDED_TERMS):
+
+
+async def _fetch_static_anchors(url: str) -> Optional[tuple[str, list[tuple[str, str]]]]:
+    """Return ``(final_url, anchors)`` from the raw HTML, or ``None`` when the browser is needed."""
+    try:
+        response = await _search_client().get(url)
+    except httpx.HTTPError as exc:
+        logger.debug("Static fetch failed for %s (%s)", url, exc)
+        return None
+    if response.status_code != 200 or "html" not in response.headers.get("content-type", ""):
+        return None
+    loop = asyncio.get_running_loop()
+    anchors = await loop.run_in_executor(_parse_pool(), _extract_anchor_pairs, response.text)
+    if not anchors:
+        return None
+    return str(response.url), anchors
+
+
+def _extract_anchor_pairs(html: str) -> list[tuple[str, str]]:
+    """Return the page's anchors, or none when the HTML is a script-app shell that must be rendered."""
+    tree = LexborHTMLParser(html)
+    if tree.css_first(SPA_SHELL_SELECTOR) is not None:
+        return []
+    return [
+        (node.text(separator=" ", strip=True), node.attributes.get("href") or "")
+        for node in tree.css("a")
+    ]
+
+
+async def _render_anchors(url: str, pages: PagePool) -> Optional[tuple[str, list[tuple[str, str]]]]:
+    async with pages.acquire() as page:
+        try:
+            response = await _goto_with_limit(page, url)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Career page navigation failed for %s (%s)", url, exc)
             return None
-        title = fallback_title or (await page.title() or "").strip()
-        if not title:
+
+        if not response or response.status != 200:
+            logger.warning("Career page %s returned status %s", url, response.status if response else None)
             return None
-        return {
-            "company_name": company_name,
-            "career_page_url": career_page_url,
-            "job_title": title,
-            "job_url": response.url,
-            "job_description": normalized,
-        }
-    except Exception as exc:  # noqa: BLE001
-        logger.debug("Job validation failed for %s: %s", job_url, exc)
-        return None
-    finally:
-        await page.close()
 
+        # Navigation returns at commit; give the app scripts a bounded chance to build the links.
+        try:
+            await page.wait_for_load_state("domcontentloaded", timeout=RENDER_WAIT_MS)
+            await page.wait_for_selector("a", state="attached", timeout=RENDER_WAIT_MS)
+        except PlaywrightTimeoutError:
+            logger.debug("No links rendered on %s within %d ms", url, RENDER_WAIT_MS)
+        return response.url, await page.eval_on_selector_all("a", ANCHOR_PAIRS_JS)
+
+
+def _collect_job_links(base_url: str, anchors: Iterable[tuple[str, str]]) -> dict[str, str]:
+    job_links: dict[str, str] = {}
+    for text, href in anchors:
+        if not href:
+            continue
+        absolute_url = _join_url(base_url, href)
+        if absolute_url in job_links or _is_aggregator(absolute_url):
+            continue
+        lower_text = text.lower()
+        if _looks_like_job_link(lower_text, absolute_url.lower()) and not _EXCLUDED_TITLE_RE.search(lower_text):
+            job_links[absolute_url] = text
+    return job_links
 
-async def _discover_nav_links(homepage_url: str, context: BrowserContext) -> list[str]:
-    page = await context.new_page()
+
+async def _discover_nav_links(homepage_url: str, pages: PagePool, failures: list[str]) -> list[str]:
     links: list[str] = []
-    try:
-        response = await _goto_with_limit(page, homepage_url)
-        if not response or response.status != 200:
+    async with pages.acquire() as page:
+        try:
+            response = await _goto_with_limit(page, homepage_url)
+            if not response or response.status != 200:
+                failures.append(homepage_url)
+                return links
+            base_url = response.url
+            anchors = await page.eval_on_selector_all("a", ANCHOR_PAIRS_JS)
+            for text, href in anchors:
+                if not href:
+                    continue
+                if _NAV_RE.search(text.lower()) or _NAV_RE.search(href.lower()):
+                    links.append(_join_url(base_url, href))
+            return links
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Navigation discovery failed for %s: %s", homepage_url, exc)
+            failures.append(homepage_url)
             return links
-        anchors = await page.query_selector_all("a")
-        for anchor in anchors:
-            text = (await anchor.inner_text() or "").strip().lower()
-            href = await anchor.get_attribute("href")
-            if not href:
-                continue
-            if any(keyword in text for keyword in NAV_KEYWORDS) or any(keyword in href.lower() for keyword in NAV_KEYWORDS):
-                links.append(urljoin(response.url, href))
-        return links
-    except Exception as exc:  # noqa: BLE001
-        logger.debug("Navigation discovery failed for %s: %s", homepage_url, exc)
-        return links
-    finally:
-        await page.close()
 
 
 def _safe_mode_variant(company_name: str) -> Optional[str]:
@@ -314,6 +463,7 @@ def _safe_mode_variant(company_name: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_search_result(url: str) -> Optional[str]:
     parsed = urlparse(url)
     if "duckduckgo.com" in parsed.netloc and parsed.path.startswith("/l/"):
@@ -325,19 +475,22 @@ def _normalize_search_result(url: str) -> Optional[str]:
     return url
 
 
-def _is_aggregator(url: str) -> bool:
-    domain = urlparse(url).netloc.lower()
-    return any(domain == bad or domain.endswith(f".{bad}") for bad in AGGREGATOR_DOMAINS)
+_join_url = functools.lru_cache(maxsize=2048)(urljoin)
 
 
-def _looks_like_job_link(text: str, url: str) -> bool:
-    combined = f"{text} {url}".lower()
-    return any(keyword in combined for keyword in JOB_KEYWORDS)
+@functools.lru_cache(maxsize=8192)
+def _netloc(url: str) -> str:
+    return urlparse(url).netloc.lower()
 
 
-def _looks_like_career_link(text: str, url: str) -> bool:
-    combined = f"{text} {url}".lower()
-    return any(keyword in combined for keyword in CAREER_LINK_KEYWORDS)
+def _is_aggregator(url: str) -> bool:
+    domain = _netloc(url)
+    return domain in AGGREGATOR_DOMAINS or domain.endswith(_AGGREGATOR_SUFFIXES)
+
+
+def _looks_like_job_link(text: str, url: str) -> bool:
+    """Expects ``text`` and ``url`` to be lowercased already."""
+    return _JOB_RE.search(text) is not None or _JOB_RE.search(url) is not None
 
 
 def _search_headers() -> dict[str, str]:
@@ -348,6 +501,26 @@ def _search_headers() -> dict[str, str]:
     }
 
 
+def _search_client() -> httpx.AsyncClient:
+    global _SEARCH_CLIENT
+    if _SEARCH_CLIENT is None:
+        _SEARCH_CLIENT = httpx.AsyncClient(
+            http2=True,
+            headers=_search_headers(),
+            timeout=SEARCH_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _SEARCH_CLIENT
+
+
+def _parse_pool() -> ProcessPoolExecutor:
+    global _PARSE_POOL
+    if _PARSE_POOL is None:
+        _PARSE_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _PARSE_POOL
+
+
 async def _goto_with_limit(page: Page, url: str):
     async with GOTO_SEMAPHORE:
         return await page.goto(url, wait_until="commit", timeout=PAGE_TIMEOUT_MS)
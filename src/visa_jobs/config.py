@@ -15,15 +15,15 @@ class AppConfig:
     """Runtime configuration for the job discovery pipeline."""
 
     sponsor_register_url: str = DEFAULT_SPONSOR_URL
-    data_dir: Path = Path(os.getenv("DATA_DIR", "data"))
-    resumes_dir: Path = Path(os.getenv("RESUMES_DIR", "resumes"))
-    daily_job_limit: int = int(os.getenv("DAILY_JOB_LIMIT", "25"))
-    max_companies: int = int(os.getenv("MAX_COMPANIES", "150"))
-    search_batch_size: int = int(os.getenv("SEARCH_BATCH_SIZE", "20"))
-    search_result_limit: int = int(os.getenv("SEARCH_RESULT_LIMIT", "5"))
-    concurrent_browsers: int = int(os.getenv("CONCURRENT_BROWSERS", "4"))
-    llm_model: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
-    openai_api_key: str | None = os.getenv("OPENAI_API_KEY")
+    data_dir: Path = Path("data")
+    resumes_dir: Path = Path("resumes")
+    daily_job_limit: int = 25
+    max_companies: int = 150
+    search_batch_size: int = 20
+    search_result_limit: int = 5
+    concurrent_browsers: int = 4
+    llm_model: str = "gpt-4o-mini"
+    openai_api_key: str | None = None
     career_page_overrides: Dict[str, str] = field(default_factory=dict)
 
     @classmethod
@@ -33,7 +33,19 @@ class AppConfig:
         path = Path(career_config_path)
         if path.exists():
             overrides = json.loads(path.read_text())
-        return cls(career_page_overrides=overrides)
+        return cls(
+            sponsor_register_url=os.getenv("SPONSOR_REGISTER_URL", DEFAULT_SPONSOR_URL),
+            data_dir=Path(os.getenv("DATA_DIR", "data")),
+            resumes_dir=Path(os.getenv("RESUMES_DIR", "resumes")),
+            daily_job_limit=int(os.getenv("DAILY_JOB_LIMIT", "25")),
+            max_companies=int(os.getenv("MAX_COMPANIES", "150")),
+            search_batch_size=int(os.getenv("SEARCH_BATCH_SIZE", "20")),
+            search_result_limit=int(os.getenv("SEARCH_RESULT_LIMIT", "5")),
+            concurrent_browsers=int(os.getenv("CONCURRENT_BROWSERS", "4")),
+            llm_model=os.getenv("LLM_MODEL", "gpt-4o-mini"),
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            career_page_overrides=overrides,
+        )
 
     def ensure_directories(self) -> None:
         for path in self.directories():
@@ -70,6 +82,14 @@ class AppConfig:
     def career_pages_path(self) -> Path:
         return self.data_dir / "tech_career_pages.csv"
 
+    @property
+    def career_cache_dir(self) -> Path:
+        return self.data_dir / "career_cache"
+
+    @property
+    def llm_cache_dir(self) -> Path:
+        return self.data_dir / "llm_cache"
+
     @property
     def log_path(self) -> Path:
         return self.data_dir / "run.log"
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import random
 from dataclasses import asdict
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
+import diskcache
 import httpx
 
+from .model import make_job_id
+
 logger = logging.getLogger(__name__)
 
 JSON_SCHEMA = {
@@ -17,55 +22,187 @@ JSON_SCHEMA = {
     "reason": "max 2 lines",
 }
 
-PROMPT_TEMPLATE = """
+# Message order runs from most to least shared: the fixed instructions, then the resume excerpt
+# (constant for every job scored against that resume), then the job fields.
+SYSTEM_PROMPT = f"""
 You are assessing a job listing for a UK Skilled Worker visa sponsored QA/Automation position.
-Return a STRICT JSON object with keys: {json_keys}.
+Return a STRICT JSON object with keys: {list(JSON_SCHEMA.keys())}.
 Consider these filters:
 - Reject junior, graduate, intern, contract, or manual-only roles.
 - Focus on QA / SDET / Automation / QE / QA Manager responsibilities.
 - Rate visa likelihood based on the company being a licensed sponsor.
+"""
+
+USER_PROMPT_TEMPLATE = """
+Resume excerpt: {resume_excerpt}
 
 Job detail:
 Title: {title}
 Company: {company}
 Description: {description}
-Resume excerpt: {resume_excerpt}
 """
 
+OPENAI_CHAT_URL = "https://api.openai.com/v1/chat/completions"
+LLM_CONCURRENCY = 32
+PROMPT_VERSION = "v3"
+LLM_CACHE_TTL = 30 * 86400
+LLM_MAX_ATTEMPTS = 4
+LLM_RETRY_STATUSES = {429, 500, 502, 503, 504}
+LLM_MAX_RETRY_DELAY = 60.0
+
 
 class LLMEvaluator:
-    def __init__(self, api_key: Optional[str], model: str):
+    def __init__(self, api_key: Optional[str], model: str, cache: diskcache.Cache | None = None):
         self.api_key = api_key
         self.model = model
+        self.cache = cache
+        self._client: httpx.Client | None = None
+
+    def __enter__(self) -> "LLMEvaluator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def evaluate(self, job: Dict[str, str], resume_text: str) -> Dict[str, str]:
         if not self.api_key:
             logger.info("OPENAI_API_KEY not set; using heuristic scoring")
             return self._heuristic_score(job, resume_text)
-        return self._call_openai(job, resume_text)
+        key = self._cache_key(job, _resume_hash(resume_text))
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        result = self._call_openai(job, resume_text)
+        self._store(key, result)
+        return result
+
+    async def evaluate_many(self, pairs: List[Tuple[Dict[str, str], str]]) -> List[Dict[str, str]]:
+        """Score (job, resume_text) pairs, issuing OpenAI calls concurrently; results keep input order."""
+        if not self.api_key:
+            logger.info("OPENAI_API_KEY not set; using heuristic scoring")
+            return [self._heuristic_score(job, resume_text) for job, resume_text in pairs]
+        resume_hashes: Dict[str, str] = {}
+        keys: List[str] = []
+        for job, resume_text in pairs:
+            if resume_text not in resume_hashes:
+                resume_hashes[resume_text] = _resume_hash(resume_text)
+            keys.append(self._cache_key(job, resume_hashes[resume_text]))
+        results: List[Optional[Dict[str, str]]] = [self._cached(key) for key in keys]
+        misses = [index for index, result in enumerate(results) if result is None]
+        if len(misses) < len(pairs):
+            logger.info("Reusing %d cached LLM evaluations", len(pairs) - len(misses))
+        if misses:
+            semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
+            async with httpx.AsyncClient(
+                http2=True,
+                timeout=60,
+                headers=self._auth_headers(),
+                limits=httpx.Limits(max_keepalive_connections=LLM_CONCURRENCY),
+            ) as client:
+                fetched = await asyncio.gather(
+                    *[
+                        self._call_openai_async(client, semaphore, keys[index], *pairs[index])
+                        for index in misses
+                    ],
+                    return_exceptions=True,
+                )
+            failed = 0
+            for index, result in zip(misses, fetched):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    logger.debug("LLM evaluation failed for %s: %s", keys[index], result)
+                    failed += 1
+                    result = self._heuristic_score(*pairs[index])
+                results[index] = result
+            if failed:
+                logger.warning("%d LLM evaluations failed after retries; using heuristic scores for them", failed)
+        return results
+
+    def _cache_key(self, job: Dict[str, str], resume_hash: str) -> str:
+        job_id = make_job_id(job.get("company", ""), job.get("title", ""), job.get("url", ""))
+        return f"{job_id}:{resume_hash}:{self.model}:{PROMPT_VERSION}"
+
+    def _cached(self, key: str) -> Optional[Dict[str, str]]:
+        if self.cache is None:
+            return None
+        return self.cache.get(key)
+
+    def _store(self, key: str, result: Dict[str, str]) -> None:
+        if self.cache is not None:
+            self.cache.set(key, result, expire=LLM_CACHE_TTL)
 
     def _call_openai(self, job: Dict[str, str], resume_text: str) -> Dict[str, str]:
-        payload = {
+        # Only single-pair ``evaluate`` calls use the sync client; the pipeline goes through ``evaluate_many``.
+        if self._client is None:
+            self._client = httpx.Client(
+                http2=True,
+                timeout=60,
+                headers=self._auth_headers(),
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        response = self._client.post(OPENAI_CHAT_URL, json=self._build_payload(job, resume_text))
+        return self._parse_response(response)
+
+    async def _call_openai_async(
+        self,
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        key: str,
+        job: Dict[str, str],
+        resume_text: str,
+    ) -> Dict[str, str]:
+        """Score one pair and cache it right away, so a later failure in the batch keeps billed results."""
+        payload = self._build_payload(job, resume_text)
+        async with semaphore:
+            for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+                try:
+                    response = await client.post(OPENAI_CHAT_URL, json=payload)
+                except httpx.TransportError as exc:
+                    if attempt == LLM_MAX_ATTEMPTS:
+                        raise
+                    delay, reason = _retry_delay(None, attempt), str(exc)
+                else:
+                    if response.status_code not in LLM_RETRY_STATUSES or attempt == LLM_MAX_ATTEMPTS:
+                        break
+                    delay, reason = _retry_delay(response, attempt), f"HTTP {response.status_code}"
+                logger.info("Retrying OpenAI call in %.1fs (%s, attempt %d)", delay, reason, attempt)
+                await asyncio.sleep(delay)
+        result = self._parse_response(response)
+        self._store(key, result)
+        return result
+
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Dict[str, str]:
+        response.raise_for_status()
+        content = response.json()["choices"][0]["message"]["content"]
+        return json.loads(content)
+
+    def _auth_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.api_key}"}
+
+    def _build_payload(self, job: Dict[str, str], resume_text: str) -> Dict[str, object]:
+        return {
             "model": self.model,
             "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {
                     "role": "user",
-                    "content": PROMPT_TEMPLATE.format(
-                        json_keys=list(JSON_SCHEMA.keys()),
+                    "content": USER_PROMPT_TEMPLATE.format(
+                        resume_excerpt=resume_text[:3000],
                         title=job.get("title", ""),
                         company=job.get("company", ""),
                         description=job.get("snippet", ""),
-                        resume_excerpt=resume_text[:3000],
                     ),
                 }
             ],
             "response_format": {"type": "json_object"},
         }
-        headers = {"Authorization": f"Bearer {self.api_key}"}
-        response = httpx.post("https://api.openai.com/v1/chat/completions", json=payload, headers=headers, timeout=60)
-        response.raise_for_status()
-        content = response.json()["choices"][0]["message"]["content"]
-        return json.loads(content)
 
     def _heuristic_score(self, job: Dict[str, str], resume_text: str) -> Dict[str, str]:
         title = job.get("title", "").lower()
@@ -93,3 +230,17 @@ class LLMEvaluator:
             "resume_match_score": resume_score,
             "reason": "Heuristic match without API",
         }
+
+
+def _retry_delay(response: httpx.Response | None, attempt: int) -> float:
+    """Honour ``Retry-After`` when the server sends seconds, else back off exponentially with jitter."""
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        delay = float(retry_after) if retry_after else 2.0**attempt + random.random()
+    except ValueError:
+        delay = 2.0**attempt + random.random()
+    return min(delay, LLM_MAX_RETRY_DELAY)
+
+
+def _resume_hash(resume_text: str) -> str:
+    return hashlib.sha1(resume_text.encode("utf-8")).hexdigest()[:16]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, fields
+from typing import Dict, Optional
 
 
 @dataclass(slots=True)
@@ -19,4 +19,16 @@ class JobOpportunity:
     llm_reason: Optional[str] = None
 
     def job_id(self) -> str:
-        return f"{self.company}|{self.title}|{self.url}"
+        return make_job_id(self.company, self.title, self.url)
+
+    def to_dict(self) -> Dict[str, object]:
+        """Shallow equivalent of ``dataclasses.asdict``; every field is a scalar so no deep copy is needed."""
+        return {name: getattr(self, name) for name in JOB_FIELDS}
+
+
+def make_job_id(company: str, title: str, url: str) -> str:
+    """Dedup and cache identity of a job; shared by ``JobOpportunity.job_id`` and the LLM cache key."""
+    return f"{company}|{title}|{url}"
+
+
+JOB_FIELDS = tuple(field.name for field in fields(JobOpportunity))
@@ -1,22 +1,51 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Dict, Set
+from typing import Set, Tuple
+
+import orjson
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+CSV_WRITE_OPTIONS = pacsv.WriteOptions(quoting_style="needed")
 
 
 def load_seen_jobs(path: Path) -> Set[str]:
-    if not path.exists():
-        return set()
-    data = json.loads(path.read_text())
-    return set(data)
+    job_ids, _ = _read_seen_jobs(path)
+    return job_ids
 
 
 def save_seen_jobs(path: Path, job_ids: Set[str]) -> None:
-    path.write_text(json.dumps(sorted(job_ids), indent=2))
+    path.write_bytes(b"".join(orjson.dumps(job_id) + b"\n" for job_id in sorted(job_ids)))
 
 
 def append_seen_jobs(path: Path, new_jobs: Set[str]) -> None:
-    existing = load_seen_jobs(path)
-    combined = existing.union(new_jobs)
-    save_seen_jobs(path, combined)
+    existing, legacy = _read_seen_jobs(path)
+    if legacy:
+        save_seen_jobs(path, existing.union(new_jobs))
+        return
+    fresh = new_jobs - existing
+    if not fresh:
+        return
+    with path.open("ab") as file:
+        for job_id in sorted(fresh):
+            file.write(orjson.dumps(job_id) + b"\n")
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write ``df`` without its index using Arrow's multi-threaded CSV writer.
+
+    Unlike ``DataFrame.to_csv``, Arrow double-quotes every header and string cell; numbers stay bare.
+    """
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path, write_options=CSV_WRITE_OPTIONS)
+
+
+def _read_seen_jobs(path: Path) -> Tuple[Set[str], bool]:
+    """Return the stored job ids and whether the file still uses the old single JSON array format."""
+    if not path.exists():
+        return set(), False
+    data = path.read_bytes()
+    if data.lstrip().startswith(b"["):
+        return set(orjson.loads(data)), True
+    return {orjson.loads(line) for line in data.splitlines() if line.strip()}, False
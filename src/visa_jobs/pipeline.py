@@ -2,39 +2,47 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from dataclasses import asdict
+import re
 from typing import Dict, List
 
+import diskcache
 import pandas as pd
 
 SKIP_COMPANY_KEYWORDS = ["retail", "training", "care", "support", "taxi", "airport", "hospitality"]
+SKIP_COMPANY_PATTERN = "|".join(re.escape(keyword) for keyword in SKIP_COMPANY_KEYWORDS)
 
 from .config import AppConfig
 from .llm import LLMEvaluator
-from .model import JobOpportunity
-from .persistence import append_seen_jobs, load_seen_jobs
+from .model import JOB_FIELDS, JobOpportunity
+from .persistence import append_seen_jobs, load_seen_jobs, write_csv
 from .resume import load_resumes
 from .scraper import scrape_careers
-from .sponsors import download_sponsor_register, export_skilled_sponsors, filter_tech_companies
+from .sponsors import (
+    download_sponsor_register,
+    export_skilled_sponsors,
+    filter_tech_companies,
+    load_sponsor_register,
+)
 
 logger = logging.getLogger(__name__)
 
-
-def _should_skip_company(name: str) -> bool:
-    lower = name.lower()
-    return any(keyword in lower for keyword in SKIP_COMPANY_KEYWORDS)
+RAW_JOB_COLUMNS = ["company", "career_page_url", "job_title", "job_url", "job_description"]
 
 
 def run_pipeline(config: AppConfig) -> None:
     config.ensure_directories()
     logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(name)s: %(message)s")
     sponsor_csv = download_sponsor_register(config)
-    sponsor_df = pd.read_csv(sponsor_csv)
+    sponsor_df = load_sponsor_register(sponsor_csv)
     skilled_df = export_skilled_sponsors(sponsor_df, config.skilled_companies_path)
     tech_companies_df = filter_tech_companies(skilled_df, config.max_companies)
 
-    company_names = [name for name in tech_companies_df["_name"].tolist() if not _should_skip_company(name)]
-    company_names = company_names[: config.search_batch_size]
+    names = tech_companies_df["_name"]
+    skip_mask = names.str.contains(SKIP_COMPANY_PATTERN, case=False, regex=True, na=False)
+    batch = names[~skip_mask].head(config.search_batch_size)
+    known_pages = batch.map(config.career_page_overrides).dropna()
+    company_names = batch.tolist()
+    career_page_overrides = dict(zip(batch.loc[known_pages.index], known_pages))
 
     logger.info("Scraping %d companies for QA roles", len(company_names))
     jobs, discovered_pages = asyncio.run(
@@ -42,6 +50,8 @@ def run_pipeline(config: AppConfig) -> None:
             company_names,
             concurrent_browsers=config.concurrent_browsers,
             search_result_limit=config.search_result_limit,
+            career_cache_dir=config.career_cache_dir,
+            career_page_overrides=career_page_overrides,
         )
     )
 
@@ -55,35 +65,40 @@ def run_pipeline(config: AppConfig) -> None:
     for column in export_columns:
         if column not in jobs_export.columns:
             jobs_export[column] = ""
-    jobs_export[export_columns].to_csv(config.career_pages_path, index=False)
+    write_csv(jobs_export[export_columns], config.career_pages_path)
     logger.info("Saved verified career pages to %s", config.career_pages_path)
 
     logger.info("Discovered %d potential jobs", len(jobs))
-    raw_records = [
-        {
-            "company": job.company,
-            "career_page_url": job.source,
-            "job_title": job.title,
-            "job_url": job.url,
-            "job_description": job.snippet,
-        }
-        for job in jobs
-    ]
-    raw_df = pd.DataFrame(raw_records)
-    raw_df.to_csv(config.raw_jobs_path, index=False)
+    raw_df = pd.DataFrame.from_records(
+        ((job.company, job.source, job.title, job.url, job.snippet) for job in jobs),
+        columns=RAW_JOB_COLUMNS,
+    )
+    write_csv(raw_df, config.raw_jobs_path)
 
     seen_ids = load_seen_jobs(config.seen_jobs_path)
     resumes = load_resumes(config.resumes_dir)
-    evaluator = LLMEvaluator(config.openai_api_key, config.llm_model)
-
-    ranked_records: List[dict] = []
-    new_job_ids = set()
 
+    unseen: Dict[str, JobOpportunity] = {}
     for job in jobs:
-        if job.job_id() in seen_ids:
+        job_id = job.job_id()
+        if job_id in seen_ids or job_id in unseen:
             continue
-        for resume_name, resume_text in resumes.items():
-            llm_output = evaluator.evaluate(asdict(job), resume_text)
+        unseen[job_id] = job
+        if len(unseen) >= config.daily_job_limit:
+            break
+    unseen_jobs = list(unseen.values())
+    resume_names = list(resumes)
+    payloads = [job.to_dict() for job in unseen_jobs]
+    pairs = [(payload, resumes[name]) for payload in payloads for name in resume_names]
+    with diskcache.Cache(str(config.llm_cache_dir)) as llm_cache, LLMEvaluator(
+        config.openai_api_key, config.llm_model, cache=llm_cache
+    ) as evaluator:
+        llm_outputs = asyncio.run(evaluator.evaluate_many(pairs))
+
+    ranked_records: List[dict] = []
+    for index, job in enumerate(unseen_jobs):
+        job_outputs = llm_outputs[index * len(resume_names) : (index + 1) * len(resume_names)]
+        for resume_name, llm_output in zip(resume_names, job_outputs):
             job.qa_relevance = int(llm_output.get("qa_relevance", 0))
             job.visa_likelihood = str(llm_output.get("visa_likelihood", "Low"))
             job.resume_match_score = int(llm_output.get("resume_match_score", 0))
@@ -91,18 +106,15 @@ def run_pipeline(config: AppConfig) -> None:
             job.llm_reason = str(llm_output.get("reason", ""))
             if job.resume_match_score < 60:
                 continue
-            ranked_records.append(asdict(job))
-        new_job_ids.add(job.job_id())
-        if len(ranked_records) >= config.daily_job_limit:
-            break
+            ranked_records.append(job.to_dict())
 
-    append_seen_jobs(config.seen_jobs_path, new_job_ids)
+    append_seen_jobs(config.seen_jobs_path, set(unseen))
 
     if not ranked_records:
         logger.warning("No jobs passed filtering or resume match threshold")
         return
 
-    ranked_df = pd.DataFrame(ranked_records)
+    ranked_df = pd.DataFrame.from_records(ranked_records, columns=JOB_FIELDS)
     ranked_df = ranked_df.sort_values(by=["resume_match_score", "qa_relevance"], ascending=False)
     rename_map = {
         "title": "job_title",
@@ -111,5 +123,5 @@ def run_pipeline(config: AppConfig) -> None:
         "snippet": "job_description",
     }
     scored_df = ranked_df.rename(columns=rename_map)
-    scored_df.to_csv(config.scored_jobs_path, index=False)
+    write_csv(scored_df, config.scored_jobs_path)
     logger.info("Saved scored jobs to %s", config.scored_jobs_path)
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
-import PyPDF2
+import pypdfium2 as pdfium
 
 logger = logging.getLogger(__name__)
 
+MAX_RESUME_WORKERS = 8
+
 
 def load_resumes(resume_dir: Path) -> Dict[str, str]:
+    paths = sorted(resume_dir.glob("*.pdf"))
+    texts: Dict[Path, Optional[str]] = {path: _read_cached_text(*_sidecar(path)) for path in paths}
+    misses = [path for path, text in texts.items() if text is None]
+    if len(misses) > 1:
+        # PDFium is not thread-safe, so uncached PDFs are extracted in separate processes.
+        with ProcessPoolExecutor(max_workers=min(MAX_RESUME_WORKERS, len(misses))) as executor:
+            texts.update(zip(misses, executor.map(extract_pdf_text, misses)))
+    elif misses:
+        texts[misses[0]] = extract_pdf_text(misses[0])
     resumes: Dict[str, str] = {}
-    for pdf_path in resume_dir.glob("*.pdf"):
-        text = extract_pdf_text(pdf_path)
+    for pdf_path, text in texts.items():
         resumes[pdf_path.name] = text
         logger.info("Loaded resume %s (%d chars)", pdf_path.name, len(text))
     if not resumes:
@@ -21,7 +32,32 @@ def load_resumes(resume_dir: Path) -> Dict[str, str]:
 
 
 def extract_pdf_text(path: Path) -> str:
-    with path.open("rb") as file:
-        reader = PyPDF2.PdfReader(file)
-        pages = [page.extract_text() or "" for page in reader.pages]
-        return "\n".join(pages)
+    """Extract text from a PDF, reusing the ``<name>.pdf.txt`` sidecar while the PDF is unchanged."""
+    cache_path, cache_key = _sidecar(path)
+    cached = _read_cached_text(cache_path, cache_key)
+    if cached is not None:
+        return cached
+    pdf = pdfium.PdfDocument(path)
+    try:
+        text = "\n".join(page.get_textpage().get_text_bounded() for page in pdf)
+    finally:
+        pdf.close()
+    try:
+        cache_path.write_text(f"{cache_key}\n{text}", encoding="utf-8", newline="")
+    except OSError as exc:
+        logger.debug("Unable to cache extracted text for %s (%s)", path.name, exc)
+    return text
+
+
+def _sidecar(path: Path) -> Tuple[Path, str]:
+    stat = path.stat()
+    return path.with_name(f"{path.name}.txt"), f"{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _read_cached_text(cache_path: Path, cache_key: str) -> str | None:
+    if not cache_path.exists():
+        return None
+    # newline="" keeps PDFium's \r\n intact so cached text hashes the same as a fresh extraction.
+    with cache_path.open(encoding="utf-8", newline="") as file:
+        key, _, text = file.read().partition("\n")
+    return text if key == cache_key else None
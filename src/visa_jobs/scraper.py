@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Iterable, List, Tuple
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Iterable, List, Mapping, Optional, Tuple
 
-from playwright.async_api import async_playwright
+import diskcache
 
-from .careers import extract_qa_jobs, find_real_career_page
+from .browser_manager import BrowserManager, PagePool
+from .careers import close_search_client, extract_qa_jobs, find_real_career_page, shutdown_parse_pool
 from .model import JobOpportunity
 
 logger = logging.getLogger(__name__)
@@ -16,50 +19,66 @@ async def scrape_careers(
     companies: Iterable[str],
     concurrent_browsers: int = 4,
     search_result_limit: int = 5,
+    career_cache_dir: Path | None = None,
+    career_page_overrides: Mapping[str, str] | None = None,
 ) -> Tuple[List[JobOpportunity], List[dict]]:
     """Discover real career pages and extract QA jobs for each company."""
-    semaphore = asyncio.Semaphore(concurrent_browsers)
-    results: list[JobOpportunity] = []
-    discovered_pages: list[dict] = []
+    overrides = career_page_overrides or {}
+    cache_ctx = diskcache.Cache(str(career_cache_dir)) if career_cache_dir else nullcontext()
 
-    async with async_playwright() as p:
-        try:
-            browser = await p.chromium.launch(headless=True, args=["--disable-gpu", "--single-process"])
-            browser_name = "chromium"
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Chromium launch failed (%s); falling back to Firefox", exc)
-            browser = await p.firefox.launch(headless=True)
-            browser_name = "firefox"
-        context = await browser.new_context()
-        logger.info("Using %s browser context for scraping", browser_name)
+    # Pages are borrowed per URL, so the pool only bounds open tabs; this bounds the search traffic.
+    semaphore = asyncio.Semaphore(max(1, concurrent_browsers))
 
-        async def bound_scrape(company: str) -> None:
-            async with semaphore:
-                career_url = await find_real_career_page(
-                    company, context=context, max_results=search_result_limit
-                )
-                if not career_url:
-                    logger.info("Skipping %s: no validated career page", company)
-                    return
-                discovered_pages.append({"company": company, "career_page_url": career_url})
-                jobs = await extract_qa_jobs(career_url, company, context=context)
-                if not jobs:
-                    logger.info("No QA jobs extracted for %s (%s)", company, career_url)
-                    return
-                for job in jobs:
-                    results.append(
-                        JobOpportunity(
-                            company=job["company_name"],
-                            title=job["job_title"],
-                            location="",
-                            url=job["job_url"],
-                            source=job["career_page_url"],
-                            snippet=job["job_description"],
-                        )
+    with cache_ctx as cache:
+        async with BrowserManager(concurrent_browsers) as manager:
+            async def bound_scrape(company: str) -> Tuple[List[JobOpportunity], Optional[dict]]:
+                async with semaphore:
+                    return await _scrape_company(
+                        company, manager.pages, overrides.get(company), search_result_limit, cache
                     )
 
-        tasks = [bound_scrape(company) for company in companies]
-        await asyncio.gather(*tasks)
-        await context.close()
-        await browser.close()
+            tasks = [bound_scrape(company) for company in companies]
+            try:
+                per_company = await asyncio.gather(*tasks)
+            finally:
+                await close_search_client()
+                shutdown_parse_pool()
+    results = [job for jobs, _ in per_company for job in jobs]
+    discovered_pages = [page for _, page in per_company if page is not None]
     return results, discovered_pages
+
+
+async def _scrape_company(
+    company: str,
+    pages: PagePool,
+    career_url: str | None,
+    search_result_limit: int,
+    cache: diskcache.Cache | None,
+) -> Tuple[List[JobOpportunity], Optional[dict]]:
+    """Return the company's QA jobs and its career page record; touches no shared state."""
+    if career_url:
+        logger.info("Using configured career page for %s: %s", company, career_url)
+    else:
+        career_url = await find_real_career_page(
+            company, pages=pages, max_results=search_result_limit, cache=cache
+        )
+    if not career_url:
+        logger.info("Skipping %s: no validated career page", company)
+        return [], None
+    discovered_page = {"company": company, "career_page_url": career_url}
+    jobs = await extract_qa_jobs(career_url, company, pages=pages)
+    if not jobs:
+        logger.info("No QA jobs extracted for %s (%s)", company, career_url)
+        return [], discovered_page
+    opportunities = [
+        JobOpportunity(
+            company=job["company_name"],
+            title=job["job_title"],
+            location="",
+            url=job["job_url"],
+            source=job["career_page_url"],
+            snippet=job["job_description"],
+        )
+        for job in jobs
+    ]
+    return opportunities, discovered_page
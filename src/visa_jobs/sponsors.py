@@ -1,19 +1,44 @@
 from __future__ import annotations
 
-import hashlib
+import atexit
+import csv
+import functools
 import logging
 import re
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import httpx
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 
 from .config import TECH_KEYWORDS, AppConfig
+from .persistence import write_csv
 
 logger = logging.getLogger(__name__)
 
 REGISTER_PAGE_URL = "https://www.gov.uk/government/publications/register-of-licensed-sponsors-workers"
+COMPANY_COLUMNS = [
+    "Organisation Name",
+    "Organisation",
+    "Organization Name",
+    "Company Name",
+    "OrganisationName",
+    "Name",
+]
+ROUTE_COLUMNS = [
+    "Route",
+    "Routes",
+    "Routes Offered",
+    "Visa Route",
+]
+DETAIL_COLUMNS = ["Town/City", "County", "Type & Rating"]
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+_CLIENT = httpx.Client(http2=True, follow_redirects=True, timeout=30, limits=httpx.Limits(keepalive_expiry=30))
+atexit.register(_CLIENT.close)
+TECH_PATTERN = "|".join(re.escape(keyword) for keyword in TECH_KEYWORDS)
+ARROW_STRING = pd.ArrowDtype(pa.string())
 
 
 def download_sponsor_register(config: AppConfig) -> Path:
@@ -24,35 +49,50 @@ def download_sponsor_register(config: AppConfig) -> Path:
         return config.sponsor_csv_path
 
     resolved_url = config.sponsor_register_url
-    content: bytes
 
     if not resolved_url.endswith(".csv"):
         resolved_url = _discover_latest_register_url(resolved_url)
 
     try:
-        content = _download_csv(resolved_url)
+        _download_csv(resolved_url, config.sponsor_csv_path)
     except httpx.HTTPStatusError as exc:
         if exc.response.status_code == 404:
             logger.warning("Register URL %s returned 404. Attempting to discover the latest asset link.", resolved_url)
             resolved_url = _discover_latest_register_url()
-            content = _download_csv(resolved_url)
+            _download_csv(resolved_url, config.sponsor_csv_path)
         else:
             raise
 
-    config.sponsor_csv_path.write_bytes(content)
     logger.info("Downloaded sponsor register from %s to %s", resolved_url, config.sponsor_csv_path)
     return config.sponsor_csv_path
 
 
-def _download_csv(url: str) -> bytes:
-    response = httpx.get(url, timeout=30)
-    response.raise_for_status()
-    return response.content
+def load_sponsor_register(path: Path) -> pd.DataFrame:
+    """Parse the register with Arrow's multi-threaded reader, keeping only the columns the pipeline uses."""
+    with path.open(newline="", encoding="utf-8-sig") as file:
+        header = next(csv.reader(file), [])
+    wanted = set(COMPANY_COLUMNS + ROUTE_COLUMNS + DETAIL_COLUMNS)
+    columns = [column for column in header if column in wanted]
+    convert_options = pacsv.ConvertOptions(
+        include_columns=columns or None,
+        column_types={column: pa.string() for column in columns},
+    )
+    return pacsv.read_csv(path, convert_options=convert_options).to_pandas()
+
+
+def _download_csv(url: str, path: Path) -> None:
+    partial_path = path.with_name(f"{path.name}.part")
+    with _CLIENT.stream("GET", url) as response:
+        response.raise_for_status()
+        with partial_path.open("wb") as file:
+            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+    partial_path.replace(path)
 
 
 def _discover_latest_register_url(page_url: Optional[str] = None) -> str:
     page = page_url or REGISTER_PAGE_URL
-    response = httpx.get(page, timeout=30)
+    response = _CLIENT.get(page)
     response.raise_for_status()
     matches = re.findall(r"https://assets\.publishing\.service\.gov\.uk/[^\"]+\.csv", response.text)
     worker_links = [link for link in matches if "worker" in link.lower()]
@@ -64,52 +104,42 @@ def _discover_latest_register_url(page_url: Optional[str] = None) -> str:
     return latest_url
 
 
-def _normalize_text(value: str) -> str:
-    return value.strip().lower()
-
-
 def export_skilled_sponsors(df: pd.DataFrame, output_path: Path) -> pd.DataFrame:
     skilled_df = _filter_skilled_worker(df)
-    skilled_df.to_csv(output_path, index=False)
+    write_csv(skilled_df, output_path)
     logger.info("Saved Skilled Worker sponsors to %s (%d rows)", output_path, len(skilled_df))
     return skilled_df
 
 
 def filter_tech_companies(df: pd.DataFrame, max_companies: int) -> pd.DataFrame:
+    """Return up to ``max_companies`` tech sponsors from the Skilled Worker rows of ``export_skilled_sponsors``."""
     company_column = _find_company_column(df)
-    skilled_df = _filter_skilled_worker(df)
-    skilled_df["_name"] = skilled_df[company_column].fillna("")
-    mask = skilled_df["_name"].apply(lambda val: _looks_like_tech(val))
-    filtered = skilled_df[mask].copy()
-    filtered = filtered.head(max_companies)
-    filtered["company_hash"] = filtered["_name"].apply(_stable_hash)
+    names = df[company_column].fillna("").astype(str)
+    mask = names.astype(ARROW_STRING).str.contains(TECH_PATTERN, case=False, regex=True)
+    filtered = df[mask.to_numpy(dtype=bool, na_value=False)].head(max_companies).copy()
+    filtered["_name"] = names.loc[filtered.index]
     return filtered
 
 
 def _find_company_column(df: pd.DataFrame) -> str:
-    for candidate in [
-        "Organisation Name",
-        "Organisation",
-        "Organization Name",
-        "Company Name",
-        "OrganisationName",
-        "Name",
-    ]:
-        if candidate in df.columns:
-            return candidate
-    raise ValueError("Unable to locate company name column in sponsor register")
+    company_column, _ = _register_columns(tuple(df.columns))
+    if company_column is None:
+        raise ValueError("Unable to locate company name column in sponsor register")
+    return company_column
 
 
 def _find_route_column(df: pd.DataFrame) -> Optional[str]:
-    for candidate in [
-        "Route",
-        "Routes",
-        "Routes Offered",
-        "Visa Route",
-    ]:
-        if candidate in df.columns:
-            return candidate
-    return None
+    _, route_column = _register_columns(tuple(df.columns))
+    return route_column
+
+
+@functools.lru_cache(maxsize=32)
+def _register_columns(columns: Tuple[str, ...]) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve the company and route columns for a header in one pass over the candidate names."""
+    present = set(columns)
+    company_column = next((candidate for candidate in COMPANY_COLUMNS if candidate in present), None)
+    route_column = next((candidate for candidate in ROUTE_COLUMNS if candidate in present), None)
+    return company_column, route_column
 
 
 def _filter_skilled_worker(df: pd.DataFrame) -> pd.DataFrame:
@@ -122,12 +152,3 @@ def _filter_skilled_worker(df: pd.DataFrame) -> pd.DataFrame:
     if skilled.empty:
         logger.warning("No Skilled Worker sponsors found after filtering")
     return skilled
-
-
-def _looks_like_tech(name: str) -> bool:
-    text = _normalize_text(name)
-    return any(keyword in text for keyword in TECH_KEYWORDS)
-
-
-def _stable_hash(value: str) -> str:
-    return hashlib.sha1(value.encode("utf-8")).hexdigest()